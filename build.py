@@ -4,24 +4,138 @@ Build the Olympics schedule HTML from data.json.
 Reads structured data, outputs a single self-contained HTML file.
 """
 
+import hashlib
 import json
 import os
+import pickle
+import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+try:
+    import orjson  # much faster C JSON codec; optional
+except ImportError:
+    orjson = None
+
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 DATA_FILE = os.path.join(SCRIPT_DIR, "data.json")
 OUTPUT_FILE = os.path.join(SCRIPT_DIR, "index.html")
 TEMPLATE_FILE = os.path.join(SCRIPT_DIR, "template.html")
+# Hash of the inputs that produced the current index.html; lets repeat
+# builds with unchanged inputs skip all parsing and substitution
+STAMP_FILE = OUTPUT_FILE + ".stamp"
+
+# Display format for the last-updated timestamp
+UPDATED_FORMAT = "%b %d, %I:%M %p %Z"
+
+# Template placeholders, without the {{ }} wrapper
+PLACEHOLDER_KEYS = (
+    "USA_GOLD", "USA_SILVER", "USA_BRONZE", "USA_TOTAL",
+    "PROJ_GOLD_MID", "PROJ_TOTAL_MID",
+    "PROJ_GOLD_LOW", "PROJ_GOLD_HIGH",
+    "PROJ_TOTAL_LOW", "PROJ_TOTAL_HIGH",
+    "EVENTS_DONE", "EVENTS_TOTAL",
+    "MEDAL_TABLE_ROWS", "TOTAL_MEDALS", "COUNTRIES_COUNT",
+    "SCHEDULE_JSON", "ATHLETES_JSON",
+    "LAST_UPDATED", "LAST_UPDATED_ISO",
+)
+
+# One compiled alternation so the template is scanned once instead of
+# once per placeholder (each str.replace pass copies the whole template).
+# Bytes pattern: the whole pipeline stays in bytes so the output is
+# encoded exactly once (template read → substitution → binary write).
+PLACEHOLDER_RE = re.compile(
+    rb"\{\{(" + b"|".join(k.encode("ascii") for k in PLACEHOLDER_KEYS) + rb")\}\}"
+)
+
+# Medal-table row markup, parsed once instead of per-iteration f-strings
+ROW_TEMPLATE = (
+    '<tr{is_usa}><td class="rank">{rank}</td>'
+    '<td><span class="flag">{flag}</span><span class="country">{country}</span></td>'
+    '<td class="num gold-num">{gold}</td><td class="num silver-num">{silver}</td>'
+    '<td class="num bronze-num">{bronze}</td><td class="num total-cell">{total}</td></tr>\n'
+)
+
+
+# Every numeric placeholder is a small count; formatting them becomes a
+# table index instead of an allocation
+_SMALL_INTS = tuple(b"%d" % i for i in range(1024))
+
+
+def _int_bytes(n):
+    """ASCII bytes for an integer, from the precomputed table when small."""
+    if 0 <= n < 1024:
+        return _SMALL_INTS[n]
+    return b"%d" % n
+
+
+def _read_bytes(path):
+    """Read a whole file with one os.read, skipping buffered-IO layers."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        size = os.fstat(fd).st_size
+        return os.read(fd, size)
+    finally:
+        os.close(fd)
+
+
+def _loads(text):
+    """Parse JSON text, preferring orjson when available."""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def _dumps(obj):
+    """Serialize to non-ASCII-escaped JSON bytes, preferring orjson."""
+    if orjson is not None:
+        # orjson emits UTF-8 bytes; that matches ensure_ascii=False
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+
+def _cached_dumps(name, obj):
+    """
+    Serialize obj to JSON bytes, reusing the bytes cached by the previous
+    build when the object is unchanged. Keyed by a blake2b hash of the
+    pickled object (C-level, far cheaper than re-encoding JSON).
+    """
+    key = hashlib.blake2b(pickle.dumps(obj)).hexdigest().encode("ascii")
+    cache_file = os.path.join(SCRIPT_DIR, f".{name}.json.cache")
+    try:
+        head, _, payload = _read_bytes(cache_file).partition(b"\n")
+        if head == key:
+            return payload
+    except OSError:
+        pass
 
+    payload = _dumps(obj)
+    with open(cache_file, "wb") as f:
+        f.write(key + b"\n" + payload)
+    return payload
 
-def build():
-    with open(DATA_FILE, "r") as f:
-        data = json.load(f)
 
-    # Get USA medals
-    usa = next((m for m in data["medal_table"] if m["code"] == "USA"), {
-        "gold": 0, "silver": 0, "bronze": 0, "total": 0
-    })
+def build():
+    data_bytes = _read_bytes(DATA_FILE)
+    template = _read_bytes(TEMPLATE_FILE)
+
+    # Skip the whole build when data + template are unchanged
+    digest = hashlib.sha256(data_bytes + template).hexdigest()
+    if os.path.exists(OUTPUT_FILE):
+        try:
+            with open(STAMP_FILE, "r") as f:
+                if f.read().strip() == digest:
+                    print(f"✅ {OUTPUT_FILE} is up to date")
+                    return
+        except OSError:
+            pass
+
+    # Both json codecs accept bytes directly, so no decode pass needed
+    data = _loads(data_bytes)
+
+    # Index the medal table by IOC code; O(1) lookups instead of linear scans
+    by_code = {m["code"]: m for m in data["medal_table"]}
+    usa = by_code.get("USA", {"gold": 0, "silver": 0, "bronze": 0, "total": 0})
 
     proj = data["usa_projection"]
     events_done = data.get("events_completed", 13)
@@ -30,54 +144,66 @@ def build():
 
     # Format last_updated for display
     try:
-        dt = datetime.fromisoformat(last_updated)
-        updated_display = dt.strftime("%b %d, %I:%M %p %Z")
-    except:
+        updated_display = datetime.fromisoformat(last_updated).strftime(UPDATED_FORMAT)
+    except (ValueError, TypeError):
         updated_display = last_updated
 
     # --- Build schedule JSON for JS ---
-    schedule_js = json.dumps(data["schedule"], ensure_ascii=False)
-    athletes_js = json.dumps(data["athletes"], ensure_ascii=False)
-    medal_table_rows = ""
+    # The two big serializations are independent of the medal-table work
+    # below, so run them on worker threads (orjson releases the GIL) and
+    # collect the results when the replacement table is assembled.
+    executor = ThreadPoolExecutor(max_workers=2)
+    fut_schedule = executor.submit(_cached_dumps, "schedule", data["schedule"])
+    fut_athletes = executor.submit(_cached_dumps, "athletes", data["athletes"])
+    # One pass over the table: build rows and total the medals together
+    rows = []
+    total_medals = 0
 
     for m in data["medal_table"]:
-        is_usa = ' class="usa-row"' if m["code"] == "USA" else ""
-        medal_table_rows += f"""<tr{is_usa}><td class="rank">{m['rank']}</td><td><span class="flag">{m['flag']}</span><span class="country">{m['country']}</span></td><td class="num gold-num">{m['gold']}</td><td class="num silver-num">{m['silver']}</td><td class="num bronze-num">{m['bronze']}</td><td class="num total-cell">{m['total']}</td></tr>\n"""
+        total_medals += m["total"]
+        # The USA row was already resolved via by_code; a pointer compare
+        # beats a per-row dict lookup + string compare
+        is_usa = ' class="usa-row"' if m is usa else ""
+        rows.append(ROW_TEMPLATE.format(is_usa=is_usa, **m))
 
-    total_medals = sum(m["total"] for m in data["medal_table"])
+    medal_table_rows = "".join(rows).encode("utf-8")
     countries_count = len(data["medal_table"])
 
-    # Read template and do replacements
-    with open(TEMPLATE_FILE, "r") as f:
-        html = f.read()
+    schedule_js = fut_schedule.result()
+    athletes_js = fut_athletes.result()
+    executor.shutdown()
+
+    # Do replacements on the template, all in bytes
+    html = template
 
     replacements = {
-        "{{USA_GOLD}}": str(usa.get("gold", 0)),
-        "{{USA_SILVER}}": str(usa.get("silver", 0)),
-        "{{USA_BRONZE}}": str(usa.get("bronze", 0)),
-        "{{USA_TOTAL}}": str(usa.get("total", 0)),
-        "{{PROJ_GOLD_MID}}": str(proj["projected_gold_mid"]),
-        "{{PROJ_TOTAL_MID}}": str(proj["projected_total_mid"]),
-        "{{PROJ_GOLD_LOW}}": str(proj["projected_gold_low"]),
-        "{{PROJ_GOLD_HIGH}}": str(proj["projected_gold_high"]),
-        "{{PROJ_TOTAL_LOW}}": str(proj["projected_total_low"]),
-        "{{PROJ_TOTAL_HIGH}}": str(proj["projected_total_high"]),
-        "{{EVENTS_DONE}}": str(events_done),
-        "{{EVENTS_TOTAL}}": str(events_total),
-        "{{MEDAL_TABLE_ROWS}}": medal_table_rows,
-        "{{TOTAL_MEDALS}}": str(total_medals),
-        "{{COUNTRIES_COUNT}}": str(countries_count),
-        "{{SCHEDULE_JSON}}": schedule_js,
-        "{{ATHLETES_JSON}}": athletes_js,
-        "{{LAST_UPDATED}}": updated_display,
-        "{{LAST_UPDATED_ISO}}": last_updated,
+        b"USA_GOLD": _int_bytes(usa.get("gold", 0)),
+        b"USA_SILVER": _int_bytes(usa.get("silver", 0)),
+        b"USA_BRONZE": _int_bytes(usa.get("bronze", 0)),
+        b"USA_TOTAL": _int_bytes(usa.get("total", 0)),
+        b"PROJ_GOLD_MID": _int_bytes(proj["projected_gold_mid"]),
+        b"PROJ_TOTAL_MID": _int_bytes(proj["projected_total_mid"]),
+        b"PROJ_GOLD_LOW": _int_bytes(proj["projected_gold_low"]),
+        b"PROJ_GOLD_HIGH": _int_bytes(proj["projected_gold_high"]),
+        b"PROJ_TOTAL_LOW": _int_bytes(proj["projected_total_low"]),
+        b"PROJ_TOTAL_HIGH": _int_bytes(proj["projected_total_high"]),
+        b"EVENTS_DONE": _int_bytes(events_done),
+        b"EVENTS_TOTAL": _int_bytes(events_total),
+        b"MEDAL_TABLE_ROWS": medal_table_rows,
+        b"TOTAL_MEDALS": _int_bytes(total_medals),
+        b"COUNTRIES_COUNT": _int_bytes(countries_count),
+        b"SCHEDULE_JSON": schedule_js,
+        b"ATHLETES_JSON": athletes_js,
+        b"LAST_UPDATED": updated_display.encode("utf-8"),
+        b"LAST_UPDATED_ISO": last_updated.encode("utf-8"),
     }
 
-    for key, val in replacements.items():
-        html = html.replace(key, val)
+    html = PLACEHOLDER_RE.sub(lambda m: replacements[m.group(1)], html)
 
-    with open(OUTPUT_FILE, "w") as f:
+    with open(OUTPUT_FILE, "wb") as f:
         f.write(html)
+    with open(STAMP_FILE, "w") as f:
+        f.write(digest)
 
     print(f"✅ Built {OUTPUT_FILE}")
     print(f"   USA: {usa.get('gold',0)}G {usa.get('silver',0)}S {usa.get('bronze',0)}B")
@@ -4,18 +4,74 @@ Update Olympics results from Wikipedia (primary) with Claude API fallback.
 Fetches medal table and marks completed events.
 """
 
-import html as html_mod
+import hashlib
 import json
+import operator
+import pickle
 import re
 import sys
 import os
+import types
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone, timedelta
+from functools import lru_cache
 from urllib.request import urlopen, Request
-from urllib.error import URLError
+from urllib.error import HTTPError
 from html.parser import HTMLParser
 
+try:
+    import requests  # keep-alive connection pooling; optional
+except ImportError:
+    requests = None
+
+try:
+    import orjson  # much faster C JSON codec; optional
+except ImportError:
+    orjson = None
+
+
+def _loads(raw):
+    """Parse JSON from str or bytes, preferring orjson when available."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
 
 DATA_FILE = os.path.join(os.path.dirname(__file__), "data.json")
+
+# Patterns compiled once at import
+# IOC code in parentheses next to an athlete, e.g. "(SUI)"
+CODE_PAREN_RE = re.compile(r'\(([A-Z]{3})\)')
+# Citation references like [1] left behind in extracted text
+CITATION_RE = re.compile(r'\[\d+\]')
+# Markdown code fences (```json ... ```) around model output
+FENCE_RE = re.compile(r'```(?:json)?\s*')
+# Sentence boundary for recap extraction
+SENTENCE_SPLIT_RE = re.compile(r'(?<=\.)\s+')
+
+# Strong signals an event has NOT happened yet / HAS happened.
+# Each compiled alternation finds any of its phrases in one pass over
+# the page text instead of one full scan per phrase; IGNORECASE means
+# the caller doesn't have to lowercase (copy) the text first.
+FUTURE_SIGNALS_RE = re.compile('|'.join(map(re.escape, [
+    "will be held",
+    "will be started",
+    "the event will",
+    "will take place",
+])), re.IGNORECASE)
+PAST_SIGNALS_RE = re.compile('|'.join(map(re.escape, [
+    "was held",
+    "was won",
+    "won the competition",
+    "won the gold",
+    "won the event",
+    "claimed gold",
+    "took gold",
+    "finished first",
+    "became the champion",
+    "became the olympic champion",
+    "won the olympic",
+])), re.IGNORECASE)
 WIKI_MEDAL_URL = "https://en.wikipedia.org/wiki/2026_Winter_Olympics_medal_table"
 WIKI_RESULTS_URL = "https://en.wikipedia.org/wiki/2026_Winter_Olympics"
 
@@ -43,19 +99,353 @@ COUNTRY_NAMES = {
     "LTU": "Lithuania", "DEN": "Denmark",
 }
 
+# Every IOC code we know about — used to reject random uppercase
+# trigrams like (THE) that CODE_PAREN_RE would otherwise accept
+VALID_IOC_CODES = frozenset(FLAG_MAP) | frozenset(COUNTRY_NAMES)
+
+# (display name, flag) per code, so medal-row assembly does one lookup
+# instead of two dict gets per row
+CODE_INFO = types.MappingProxyType({
+    code: (COUNTRY_NAMES.get(code), FLAG_MAP.get(code, "🏳️"))
+    for code in VALID_IOC_CODES
+})
+
+
+class _TextExtractor(HTMLParser):
+    """
+    Collect visible text from HTML, skipping <script>/<style> contents.
+    Paragraph texts are collected during the same pass so recap
+    extraction doesn't need to re-parse the page.
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self._skip = 0
+        self.parts = []
+        self.paragraphs = []
+        self._p_parts = None
+
+    def _close_paragraph(self):
+        if self._p_parts is not None:
+            self.paragraphs.append(" ".join("".join(self._p_parts).split()))
+        self._p_parts = None
+
+    def handle_starttag(self, tag, attrs):
+        if tag in ("script", "style"):
+            self._skip += 1
+        elif tag == "p":
+            self._close_paragraph()
+            self._p_parts = []
+
+    def handle_endtag(self, tag):
+        if tag in ("script", "style") and self._skip:
+            self._skip -= 1
+        elif tag == "p":
+            self._close_paragraph()
+
+    def handle_data(self, data):
+        if not self._skip:
+            self.parts.append(data)
+            if self._p_parts is not None:
+                self._p_parts.append(data)
+
+
+class _LineExtractor(HTMLParser):
+    """
+    Collect visible text as lines in one pass: <br> and closing
+    block-level tags break lines, like the old tag-replacement chain,
+    and newlines inside text keep splitting so line structure matches
+    the previous regex pipeline exactly.
+    """
+
+    _BREAK_TAGS = frozenset({"p", "h1", "h2", "h3", "h4", "h5", "h6", "div", "li"})
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self._skip = 0
+        self._buf = []
+        self.lines = []
+
+    def _flush(self):
+        for piece in "".join(self._buf).split("\n"):
+            piece = piece.strip()
+            if piece:
+                self.lines.append(piece)
+        self._buf.clear()
+
+    def handle_starttag(self, tag, attrs):
+        if tag in ("script", "style"):
+            self._skip += 1
+        elif tag == "br":
+            self._flush()
+
+    def handle_endtag(self, tag):
+        if tag in ("script", "style") and self._skip:
+            self._skip -= 1
+        elif tag in self._BREAK_TAGS:
+            self._flush()
+
+    def close(self):
+        super().close()
+        self._flush()
+
+    def handle_data(self, data):
+        if not self._skip:
+            self._buf.append(data)
+
+
+def html_to_lines(page_html):
+    """Non-empty visible text lines from a page, in document order."""
+    parser = _LineExtractor()
+    parser.feed(page_html)
+    parser.close()
+    return parser.lines
+
+
+class _WikiTableParser(HTMLParser):
+    """
+    Parse the first wikitable on a page into rows of (text, links) cells
+    in a single pass. links is a list of (href, link_text) tuples for the
+    anchors found inside the cell; entities are decoded by the parser.
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.rows = []
+        self.done = False
+        self._depth = 0          # nesting level inside the target table
+        self._row = None
+        self._cell = None        # ([text parts], [links]) while open
+        self._href = None
+        self._link_parts = None
+
+    def _close_cell(self):
+        if self._cell is not None and self._row is not None:
+            parts, links = self._cell
+            self._row.append(("".join(parts), links))
+        self._cell = None
+
+    def _close_row(self):
+        self._close_cell()
+        if self._row:
+            self.rows.append(self._row)
+        self._row = None
+
+    def handle_starttag(self, tag, attrs):
+        if self.done:
+            return
+        if self._depth == 0:
+            if tag == "table" and "wikitable" in (dict(attrs).get("class") or ""):
+                self._depth = 1
+            return
+        if tag == "table":
+            self._depth += 1
+            return
+        if self._depth > 1:
+            return
+        if tag == "tr":
+            self._close_row()
+            self._row = []
+        elif tag in ("td", "th"):
+            self._close_cell()
+            self._cell = ([], [])
+        elif tag == "a" and self._cell is not None:
+            self._href = dict(attrs).get("href") or ""
+            self._link_parts = []
+
+    def handle_endtag(self, tag):
+        if self.done or self._depth == 0:
+            return
+        if tag == "table":
+            self._depth -= 1
+            if self._depth == 0:
+                self._close_row()
+                self.done = True
+        elif self._depth > 1:
+            return
+        elif tag == "tr":
+            self._close_row()
+        elif tag in ("td", "th"):
+            self._close_cell()
+        elif tag == "a" and self._link_parts is not None:
+            self._cell[1].append((self._href, "".join(self._link_parts)))
+            self._href = None
+            self._link_parts = None
+
+    def handle_data(self, data):
+        if self.done or self._depth == 0 or self._cell is None:
+            return
+        self._cell[0].append(data)
+        if self._link_parts is not None:
+            self._link_parts.append(data)
+
+
+@lru_cache(maxsize=4)
+def parse_first_wikitable(page_html):
+    """
+    Rows of (text, links) cells from the page's first wikitable.
+
+    Cached: the medal-table page is parsed by both the medal parser and
+    the events-completed count, and hashing the string once is far
+    cheaper than a second full HTMLParser pass over it.
+    """
+    parser = _WikiTableParser()
+    # Jump straight to the table: locate the wikitable class token and
+    # back up to its opening tag so the page head is never tokenized
+    anchor = page_html.find("wikitable")
+    start = page_html.rfind("<table", 0, anchor) if anchor >= 0 else 0
+    if start < 0:
+        start = 0
+    # Feed in slices and stop once the table closes — everything after
+    # it (usually most of the page) is skipped entirely
+    for pos in range(start, len(page_html), 65536):
+        parser.feed(page_html[pos:pos + 65536])
+        if parser.done:
+            break
+    parser.close()
+    return parser.rows
+
+
+def html_to_text(page_html):
+    """
+    Extract whitespace-normalized visible text from a page in one pass.
+    Replaces repeated regex tag-strip + unescape passes; entities are
+    decoded by the parser and script/style bodies are dropped.
+    """
+    parser = _TextExtractor()
+    parser.feed(page_html)
+    return " ".join(" ".join(parser.parts).split())
+
+
+USER_AGENT = "Mozilla/5.0 (compatible; OlympicsTracker/1.0)"
+
+# Pages fetched so far this run, keyed by URL. Several event IDs map to
+# the same tournament page, so the memo avoids duplicate downloads.
+_FETCH_CACHE = {}
+
+# On-disk copies of fetched pages keyed by sha1(url), stored with their
+# ETag/Last-Modified validators. Wikipedia honors conditional GETs, so a
+# steady-state run revalidates with tiny 304 responses instead of
+# re-downloading full pages.
+CACHE_DIR = os.path.join(os.path.dirname(__file__), ".cache")
+
+
+def _cache_path(url):
+    return os.path.join(CACHE_DIR, hashlib.sha1(url.encode("utf-8")).hexdigest())
+
+
+def _load_cache_entry(url):
+    """Return (etag, last_modified, body) for url, or Nones if uncached."""
+    try:
+        with open(_cache_path(url), "rb") as f:
+            return pickle.load(f)
+    except (OSError, pickle.UnpicklingError, ValueError, EOFError):
+        return None, None, None
+
+
+def _store_cache_entry(url, etag, last_modified, body):
+    # Without a validator a cached copy can never be revalidated, so
+    # don't bother storing one. The cache is best-effort throughout.
+    if not etag and not last_modified:
+        return
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        path = _cache_path(url)
+        with open(path + ".tmp", "wb") as f:
+            pickle.dump((etag, last_modified, body), f)
+        os.replace(path + ".tmp", path)
+    except OSError:
+        pass
+
+# One keep-alive session for every fetch — all URLs here point at
+# en.wikipedia.org, so a single pooled connection skips the TCP+TLS
+# handshake on all but the first request.
+if requests is not None:
+    SESSION = requests.Session()
+    SESSION.headers["User-Agent"] = USER_AGENT
+    # pool_maxsize matches the scrape thread pool so no worker ever
+    # discards a connection for want of a pool slot
+    SESSION.mount("https://", requests.adapters.HTTPAdapter(
+        pool_connections=1, pool_maxsize=8, max_retries=2))
+else:
+    SESSION = None
+
 
 def fetch_url(url):
-    """Fetch URL content with a browser-like user agent."""
-    req = Request(url, headers={
-        "User-Agent": "Mozilla/5.0 (compatible; OlympicsTracker/1.0)"
-    })
+    """
+    Fetch URL content with a browser-like user agent. Cached per run,
+    and revalidated against the on-disk copy with a conditional GET
+    across runs.
+    """
+    cached = _FETCH_CACHE.get(url)
+    if cached is not None:
+        return cached
+
+    etag, last_modified, cached_body = _load_cache_entry(url)
+    cond_headers = {}
+    if cached_body is not None:
+        if etag:
+            cond_headers["If-None-Match"] = etag
+        if last_modified:
+            cond_headers["If-Modified-Since"] = last_modified
+
     try:
-        with urlopen(req, timeout=15) as resp:
-            return resp.read().decode("utf-8", errors="replace")
-    except URLError as e:
+        if SESSION is not None:
+            resp = SESSION.get(url, headers=cond_headers, timeout=15)
+            if resp.status_code == 304:
+                body = cached_body
+            else:
+                # error pages must not be parsed or cached; match the
+                # urllib branch, which raises through HTTPError
+                resp.raise_for_status()
+                body = resp.text
+                _store_cache_entry(url, resp.headers.get("ETag"),
+                                   resp.headers.get("Last-Modified"), body)
+        else:
+            req = Request(url, headers={"User-Agent": USER_AGENT, **cond_headers})
+            try:
+                with urlopen(req, timeout=15) as resp:
+                    body = resp.read().decode("utf-8", errors="replace")
+                    _store_cache_entry(url, resp.headers.get("ETag"),
+                                       resp.headers.get("Last-Modified"), body)
+            except HTTPError as e:
+                if e.code != 304:
+                    raise
+                body = cached_body
+    except OSError as e:  # URLError and requests exceptions both subclass it
         print(f"  ⚠️  Failed to fetch {url}: {e}")
         return None
 
+    _FETCH_CACHE[url] = body
+    return body
+
+
+# Extracted content per URL — tournament pages are shared by several event
+# IDs, so the multi-hundred-KB parse runs once per page, not per event
+_TEXT_CACHE = {}
+
+
+def page_content(url):
+    """
+    Fetch a page and return (visible text, paragraph texts), parsed in a
+    single pass. Both the download and the parse are cached per run.
+    """
+    content = _TEXT_CACHE.get(url)
+    if content is None:
+        html = fetch_url(url)
+        if html is None:
+            return None, None
+        parser = _TextExtractor()
+        parser.feed(html)
+        content = (" ".join(" ".join(parser.parts).split()), parser.paragraphs)
+        _TEXT_CACHE[url] = content
+    return content
+
+
+def page_text(url):
+    """Fetch a page and return its visible text; cached per run."""
+    return page_content(url)[0]
+
 
 def parse_wiki_medal_table(html):
     """
@@ -65,57 +455,37 @@ def parse_wiki_medal_table(html):
     if not html:
         return None
 
-    # Reverse lookup: country name -> IOC code
-    _name_to_code = {}
-    for code, name in COUNTRY_NAMES.items():
-        _name_to_code[name.lower()] = code
-    # Wikipedia variants that differ from COUNTRY_NAMES
-    _name_to_code["czech republic"] = "CZE"
-    _name_to_code["republic of korea"] = "KOR"
-    _name_to_code["people's republic of china"] = "CHN"
-    _name_to_code["great britain"] = "GBR"
-    _name_to_code["roc"] = "ROC"
-
     medals = []
 
-    # Find the first wikitable (may or may not have "sortable")
-    table_match = re.search(
-        r'<table[^>]*class="[^"]*wikitable[^"]*"[^>]*>(.*?)</table>',
-        html, re.DOTALL
-    )
-    if not table_match:
+    # One-pass parse of the first wikitable (may or may not be "sortable")
+    rows = parse_first_wikitable(html)
+    if not rows:
         print("  ⚠️  Could not find medal table on Wikipedia")
         return None
 
-    table_html = table_match.group(1)
-    rows = re.findall(r'<tr[^>]*>(.*?)</tr>', table_html, re.DOTALL)
-
-    for row in rows:
+    for cells in rows:
         # Skip header rows and total/footer rows
-        if 'Totals' in row or 'Total' in row:
+        if any('Total' in text for text, _links in cells):
             continue
-
-        # Extract all cells (both <th> and <td>)
-        cells = re.findall(r'<t[hd][^>]*>(.*?)</t[hd]>', row, re.DOTALL)
         if len(cells) < 5:
             continue
 
-        # Find the country name — look in the cell that contains a link
-        # to "X_at_the_2026_Winter_Olympics"
+        # Find the country name — look for the cell whose link points at
+        # "X_at_the_2026_Winter_Olympics"
         country_name = None
         code = None
-        for cell in cells:
-            link_match = re.search(
-                r'at_the_2026_Winter_Olympics[^"]*"[^>]*>([^<]+)', cell
-            )
-            if link_match:
-                country_name = link_match.group(1).strip().rstrip('*')
+        for _text, links in cells:
+            for href, link_text in links:
+                if 'at_the_2026_Winter_Olympics' in href:
+                    country_name = link_text.strip().rstrip('*')
+                    break
+            if country_name:
                 break
 
         if not country_name:
-            # Fallback: strip HTML from each cell, find one that looks like a name
-            for cell in cells:
-                clean = html_mod.unescape(re.sub(r'<[^>]+>', '', cell)).strip().rstrip('*')
+            # Fallback: find a cell whose text looks like a name
+            for text, _links in cells:
+                clean = text.strip().rstrip('*')
                 if clean and not clean.isdigit() and len(clean) > 2:
                     country_name = clean
                     break
@@ -124,33 +494,34 @@ def parse_wiki_medal_table(html):
             continue
 
         # Resolve country name to IOC code
-        code = _name_to_code.get(country_name.lower())
+        code = WIKI_NAME_TO_CODE.get(country_name.lower())
         if not code:
-            # Try partial match
-            for name_key, name_code in _name_to_code.items():
-                if name_key in country_name.lower() or country_name.lower() in name_key:
-                    code = name_code
-                    break
+            # Partial match: one scan against every known name at once
+            alt_match = NAME_ALT_RE.search(country_name)
+            if alt_match:
+                code = WIKI_NAME_TO_CODE[alt_match.group(1).lower()]
         if not code:
             print(f"  ⚠️  Unknown country: {country_name}")
             continue
 
-        # Extract medal numbers — last 4 digits in the row
-        numbers = []
-        for cell in cells:
-            clean = re.sub(r'<[^>]+>', '', cell).strip()
-            if clean.isdigit():
-                numbers.append(int(clean))
-
-        if len(numbers) < 4:
-            continue
-
-        gold, silver, bronze, total = numbers[-4], numbers[-3], numbers[-2], numbers[-1]
+        # Medal counts are the last four columns (Gold, Silver, Bronze,
+        # Total), so read them positionally; fall back to scanning every
+        # cell only when a footnote cell breaks the layout
+        try:
+            gold, silver, bronze, total = (
+                int(text.strip()) for text, _links in cells[-4:])
+        except ValueError:
+            numbers = [int(clean) for text, _links in cells
+                       if (clean := text.strip()).isdigit()]
+            if len(numbers) < 4:
+                continue
+            gold, silver, bronze, total = numbers[-4:]
 
+        display, flag = CODE_INFO.get(code) or (None, "🏳️")
         medals.append({
-            "country": COUNTRY_NAMES.get(code, country_name),
+            "country": display or country_name,
             "code": code,
-            "flag": FLAG_MAP.get(code, "🏳️"),
+            "flag": flag,
             "gold": gold,
             "silver": silver,
             "bronze": bronze,
@@ -161,8 +532,10 @@ def parse_wiki_medal_table(html):
         print("  ⚠️  Parsed 0 medal entries from Wikipedia")
         return None
 
-    # Sort by gold, then silver, then bronze
-    medals.sort(key=lambda x: (-x["gold"], -x["silver"], -x["bronze"]))
+    # Sort by gold, then silver, then bronze. itemgetter builds the key
+    # tuple in C, and reverse=True on all-int keys orders identically to
+    # negating each component (stability included).
+    medals.sort(key=operator.itemgetter("gold", "silver", "bronze"), reverse=True)
 
     # Add ranks
     for i, m in enumerate(medals):
@@ -179,45 +552,60 @@ def parse_events_completed(html):
     if not html:
         return None
 
-    # Find the wikitable
-    table_match = re.search(
-        r'<table[^>]*class="[^"]*wikitable[^"]*"[^>]*>(.*?)</table>',
-        html, re.DOTALL
-    )
-    if not table_match:
+    # One-pass parse of the first wikitable, shared with the medal parser
+    rows = parse_first_wikitable(html)
+    if not rows:
         return None
 
     # Find the Totals row
-    rows = re.findall(r'<tr[^>]*>(.*?)</tr>', table_match.group(1), re.DOTALL)
-    for row in rows:
-        if 'Totals' not in row and 'Total' not in row:
+    for cells in rows:
+        if not any('Total' in text for text, _links in cells):
             continue
-        cells = re.findall(r'<t[hd][^>]*>(.*?)</t[hd]>', row, re.DOTALL)
-        numbers = [int(re.sub(r'<[^>]+>', '', c).strip())
-                   for c in cells if re.sub(r'<[^>]+>', '', c).strip().isdigit()]
-        if numbers:
-            # First number is total golds = approximate events completed
-            return numbers[0]
+        for text, _links in cells:
+            clean = text.strip()
+            if clean.isdigit():
+                # First number is total golds = approximate events completed
+                return int(clean)
 
     return None
 
 
-def update_via_claude_api(data):
+def _extract_json_object(text):
     """
-    Fallback: Use Claude API with web search to get latest results.
-    Requires ANTHROPIC_API_KEY environment variable.
+    Return the first balanced {...} object in text, or None.
+
+    A linear bracket-depth walk (string literals and escapes respected)
+    replaces the old greedy \\{[\\s\\S]*\\} regex, which backtracked
+    across the whole response and happily glued the first { to a stray
+    closing brace far past the object.
     """
-    api_key = os.environ.get("ANTHROPIC_API_KEY")
-    if not api_key:
-        print("  ⚠️  No ANTHROPIC_API_KEY set, skipping Claude fallback")
+    start = text.find('{')
+    if start == -1:
         return None
+    depth = 0
+    in_string = False
+    escaped = False
+    for i in range(start, len(text)):
+        c = text[i]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif c == '\\':
+                escaped = True
+            elif c == '"':
+                in_string = False
+        elif c == '"':
+            in_string = True
+        elif c == '{':
+            depth += 1
+        elif c == '}':
+            depth -= 1
+            if depth == 0:
+                return text[start:i + 1]
+    return None
 
-    print("  🤖 Using Claude API fallback...")
-
-    import json as json_mod
-    from urllib.request import urlopen, Request
 
-    prompt = """Search for the current 2026 Winter Olympics medal table and any results from today.
+CLAUDE_PROMPT = """Search for the current 2026 Winter Olympics medal table and any results from today.
 
 Return ONLY valid JSON with this exact structure (no markdown, no explanation):
 {
@@ -233,14 +621,41 @@ Return ONLY valid JSON with this exact structure (no markdown, no explanation):
 
 Include ALL countries that have won at least one medal. Sort by gold medals descending."""
 
-    request_body = json_mod.dumps({
-        "model": "claude-haiku-4-5-20251001",
-        "max_tokens": 2000,
-        "tools": [{"type": "web_search_20250305", "name": "web_search"}],
-        "messages": [{"role": "user", "content": prompt}]
-    }).encode("utf-8")
+# The whole request body is static (the key travels in a header), so
+# encode it once at import instead of per fallback call
+CLAUDE_REQUEST_BODY = json.dumps({
+    "model": "claude-haiku-4-5-20251001",
+    "max_tokens": 2000,
+    "tools": [{"type": "web_search_20250305", "name": "web_search"}],
+    "messages": [{
+        "role": "user",
+        "content": [{
+            # The instructions + schema never change between cron
+            # runs. Note: at its current size this prompt is below the
+            # API's minimum cacheable length, so the marker is a no-op
+            # until the prompt grows past that threshold — it's kept so
+            # caching kicks in automatically if it ever does.
+            "type": "text",
+            "text": CLAUDE_PROMPT,
+            "cache_control": {"type": "ephemeral"},
+        }],
+    }]
+}).encode("utf-8")
+
+
+def update_via_claude_api(data):
+    """
+    Fallback: Use Claude API with web search to get latest results.
+    Requires ANTHROPIC_API_KEY environment variable.
+    """
+    api_key = os.environ.get("ANTHROPIC_API_KEY")
+    if not api_key:
+        print("  ⚠️  No ANTHROPIC_API_KEY set, skipping Claude fallback")
+        return None
+
+    print("  🤖 Using Claude API fallback...")
 
-    req = Request("https://api.anthropic.com/v1/messages", data=request_body, headers={
+    req = Request("https://api.anthropic.com/v1/messages", data=CLAUDE_REQUEST_BODY, headers={
         "Content-Type": "application/json",
         "x-api-key": api_key,
         "anthropic-version": "2023-06-01",
@@ -248,7 +663,8 @@ Include ALL countries that have won at least one medal. Sort by gold medals desc
 
     try:
         with urlopen(req, timeout=30) as resp:
-            response = json_mod.loads(resp.read().decode("utf-8"))
+            # both codecs take the raw bytes, so no decode pass
+            response = _loads(resp.read())
     except Exception as e:
         print(f"  ⚠️  Claude API request failed: {e}")
         return None
@@ -263,19 +679,17 @@ Include ALL countries that have won at least one medal. Sort by gold medals desc
 
     # Try to extract JSON from the response
     # Strip markdown fences if present
-    clean = re.sub(r'```json\s*', '', full_text)
-    clean = re.sub(r'```\s*', '', clean)
-    clean = clean.strip()
+    clean = FENCE_RE.sub('', full_text).strip()
 
     try:
-        result = json_mod.loads(clean)
-    except json_mod.JSONDecodeError:
-        # Try to find JSON object in the text
-        json_match = re.search(r'\{[\s\S]*\}', clean)
-        if json_match:
+        result = _loads(clean)
+    except json.JSONDecodeError:
+        # Try to find a balanced JSON object in the text
+        json_text = _extract_json_object(clean)
+        if json_text:
             try:
-                result = json_mod.loads(json_match.group())
-            except json_mod.JSONDecodeError:
+                result = _loads(json_text)
+            except json.JSONDecodeError:
                 print("  ⚠️  Could not parse Claude's response as JSON")
                 return None
         else:
@@ -287,10 +701,11 @@ Include ALL countries that have won at least one medal. Sort by gold medals desc
     if medal_table:
         for i, entry in enumerate(medal_table):
             code = entry.get("code", "")
-            entry["flag"] = FLAG_MAP.get(code, "🏳️")
+            display, flag = CODE_INFO.get(code) or (None, "🏳️")
+            entry["flag"] = flag
             entry["rank"] = i + 1
             if "country" not in entry:
-                entry["country"] = COUNTRY_NAMES.get(code, code)
+                entry["country"] = display or code
 
     return result
 
@@ -379,48 +794,106 @@ TOURNAMENT_GAME_MAP = {
     "hoc-m-gold": ("Ice_hockey_at_the_2026_Winter_Olympics_%E2%80%93_Men%27s_tournament", "Canada"),
 }
 
-# Reverse lookup: country name fragments to 3-letter codes
-NAME_TO_CODE = {}
-for code, name in COUNTRY_NAMES.items():
-    NAME_TO_CODE[name.lower()] = code
-    # Also add partial names
-    for part in name.lower().split():
-        if len(part) > 3:
-            NAME_TO_CODE[part] = code
-# Add common Wikipedia variants
-NAME_TO_CODE.update({
-    "swiss": "SUI", "chinese": "CHN", "american": "USA", "japanese": "JPN",
-    "norwegian": "NOR", "italian": "ITA", "german": "GER", "french": "FRA",
-    "austrian": "AUT", "swedish": "SWE", "canadian": "CAN", "korean": "KOR",
-    "czech": "CZE", "slovenian": "SLO", "dutch": "NED", "finnish": "FIN",
-    "british": "GBR", "australian": "AUS",
-    "the united states": "USA", "united states": "USA",
-    "switzerland": "SUI",
+# The ids each scraper can handle; membership here is what makes an
+# event a scrape candidate in update_event_results
+MEDAL_EIDS = frozenset(EVENT_WIKI_MAP)
+TOURNAMENT_EIDS = frozenset(TOURNAMENT_GAME_MAP)
+
+def _build_name_to_code():
+    """Reverse lookup: country name fragments to 3-letter codes."""
+    name_to_code = {}
+    for code, name in COUNTRY_NAMES.items():
+        name_to_code[name.lower()] = code
+        # Also add partial names. setdefault keeps the first owner of a
+        # fragment shared by two countries instead of silently letting
+        # the later one win; ambiguous fragments stay deterministic.
+        for part in name.lower().split():
+            if len(part) > 3:
+                name_to_code.setdefault(part, code)
+    # Add common Wikipedia variants
+    name_to_code.update({
+        "swiss": "SUI", "chinese": "CHN", "american": "USA", "japanese": "JPN",
+        "norwegian": "NOR", "italian": "ITA", "german": "GER", "french": "FRA",
+        "austrian": "AUT", "swedish": "SWE", "canadian": "CAN", "korean": "KOR",
+        "czech": "CZE", "slovenian": "SLO", "dutch": "NED", "finnish": "FIN",
+        "british": "GBR", "australian": "AUS",
+        "the united states": "USA", "united states": "USA",
+        "switzerland": "SUI",
+    })
+    return name_to_code
+
+
+# Built exactly once and frozen — nothing mutates this after import
+NAME_TO_CODE = types.MappingProxyType(_build_name_to_code())
+
+# Wikipedia spellings that differ from COUNTRY_NAMES, layered over the
+# shared reverse map for medal-table resolution
+WIKI_NAME_TO_CODE = types.MappingProxyType({
+    **NAME_TO_CODE,
+    "czech republic": "CZE",
+    "republic of korea": "KOR",
+    "people's republic of china": "CHN",
+    "great britain": "GBR",
+    "roc": "ROC",
 })
 
+# One alternation over every known name, longest key first so
+# "united states" beats "united". A single C-level scan replaces the
+# O(keys) Python substring loop per unresolved country.
+NAME_ALT_RE = re.compile(
+    r'\b(' + '|'.join(re.escape(k) for k in
+                      sorted(WIKI_NAME_TO_CODE, key=len, reverse=True)) + r')\b',
+    re.IGNORECASE)
+
+# Words the won_patterns country group can capture that are never a
+# country reference; skipping them saves the dict lookup
+_STOPWORDS = frozenset({"the", "team", "of", "a", "an"})
+
+# Uppercased tokens that look like a surname in the page text but never
+# are; frozenset gives O(1) membership instead of a list scan
+_GARBAGE_WORDS = frozenset({
+    'ROUND', 'FINAL', 'QUALIFICATION', 'TRAINING', 'OFFICIAL', 'SESSION',
+    'MEDAL', 'EVENT', 'COMPETITION', 'OLYMPIC', 'WINTER', 'GAMES',
+})
 
-def _extract_recap(page_html, winner_name=None, country_code=None):
+# "X of Country won gold" prose pattern — all three verb phrasings in
+# one alternation so an event page gets a single scan instead of three.
+# The name group is capped at {1,3} extra tokens: an unbounded repeat of
+# overlapping classes can backtrack catastrophically on a near-miss in
+# page-sized input.
+WON_RE = re.compile(
+    r'([A-Z][a-záéíóúñ]+(?:\s+[A-Z][a-záéíóúñ]+){1,3})\s+(?:of\s+)?(\w+)\s+'
+    r'(?:won\s+the\s+competition'
+    r'|claimed?\s+(?:the\s+)?(?:olympic\s+)?gold'
+    r'|won\s+(?:the\s+)?(?:olympic\s+)?gold)')
+
+# Infobox/table medalist patterns. The gap between the gold marker and
+# the athlete link is bounded: an unbounded .*? would drag the scan
+# across the whole page when the trailing <a> never matches
+GOLD_SECTION_RE = re.compile(
+    r'(?:1st\s*place|Gold|gold_medalist|🥇).{0,4000}?<a[^>]*title="([^"]+)"[^>]*>([^<]+)</a>',
+    re.DOTALL | re.IGNORECASE)
+SILVER_MARKER_RE = re.compile(r'(?:2nd\s*place|Silver|silver_medalist|🥈)', re.IGNORECASE)
+RANK1_RE = re.compile(
+    r'<t[dh][^>]*>\s*1\s*</t[dh]>.*?<a[^>]*title="([^"]+)"[^>]*>([^<]+)</a>',
+    re.DOTALL)
+
+
+def _extract_recap(paragraphs, winner_name=None, country_code=None):
     """
-    Extract a short recap from the Wikipedia article's lead paragraph.
-    Returns a concise 1-line description or None.
+    Extract a short recap from the article's lead paragraphs (as produced
+    by page_content). Returns a concise 1-line description or None.
     """
-    if not page_html:
+    if not paragraphs:
         return None
 
-    # Strip style/script tags, then find <p> tags
-    clean = re.sub(r'<style[^>]*>.*?</style>', '', page_html, flags=re.DOTALL)
-    clean = re.sub(r'<script[^>]*>.*?</script>', '', clean, flags=re.DOTALL)
-    paragraphs = re.findall(r'<p[^>]*>(.*?)</p>', clean, re.DOTALL)
-
-    for p_html in paragraphs[:5]:
-        text = html_mod.unescape(re.sub(r'<[^>]+>', '', p_html)).strip()
-        text = re.sub(r'\s+', ' ', text)
-        text = re.sub(r'\[\d+\]', '', text)  # remove citation refs like [1]
+    for text in paragraphs[:5]:
+        text = CITATION_RE.sub('', text)  # remove citation refs like [1]
         if len(text) < 40:
             continue
 
         # Look for a sentence with a result keyword
-        sentences = re.split(r'(?<=\.)\s+', text)
+        sentences = SENTENCE_SPLIT_RE.split(text)
         for s in sentences:
             s_lower = s.lower()
             if any(kw in s_lower for kw in ['won', 'claimed', 'took', 'earned',
@@ -454,33 +927,13 @@ def scrape_event_result(event_id):
 
     # First check: does the page indicate the event is COMPLETED?
     # If the page says "will be held" but NOT "was held/was won", skip it
-    text_only = re.sub(r'<[^>]+>', ' ', html)
-    text_only = html_mod.unescape(text_only)
-    text_lower = text_only.lower()
-    
-    # Strong signals the event has NOT happened yet
-    future_signals = [
-        "will be held",
-        "will be started",
-        "the event will",
-        "will take place",
-    ]
-    past_signals = [
-        "was held",
-        "was won",
-        "won the competition",
-        "won the gold",
-        "won the event",
-        "claimed gold",
-        "took gold",
-        "finished first",
-        "became the champion",
-        "became the olympic champion",
-        "won the olympic",
-    ]
-    
-    has_future = any(sig in text_lower for sig in future_signals)
-    has_past = any(sig in text_lower for sig in past_signals)
+    text_only, paragraphs = page_content(url)
+    # The tense phrasing lives in the article lede, so a 6KB head is
+    # enough; the patterns are IGNORECASE so no lowercased copy is made
+    head = text_only[:6000]
+
+    has_future = FUTURE_SIGNALS_RE.search(head) is not None
+    has_past = PAST_SIGNALS_RE.search(head) is not None
     
     # If page only has future tense and no past tense, event hasn't happened
     if has_future and not has_past:
@@ -494,35 +947,24 @@ def scrape_event_result(event_id):
     winner_name = None
     country_code = None
     
-    # Pattern A: "X won the competition" or "X claimed gold"  
-    won_patterns = [
-        r'([A-Z][a-záéíóúñ]+(?:\s+[A-Z][a-záéíóúñ]+)+)\s+(?:of\s+)?(\w+)\s+won\s+the\s+competition',
-        r'([A-Z][a-záéíóúñ]+(?:\s+[A-Z][a-záéíóúñ]+)+)\s+(?:of\s+)?(\w+)\s+claimed?\s+(?:the\s+)?(?:olympic\s+)?gold',
-        r'([A-Z][a-záéíóúñ]+(?:\s+[A-Z][a-záéíóúñ]+)+)\s+(?:of\s+)?(\w+)\s+won\s+(?:the\s+)?(?:olympic\s+)?gold',
-    ]
-    
-    for pattern in won_patterns:
-        m = re.search(pattern, text_only)
-        if m:
-            winner_name = m.group(1).strip()
-            country_word = m.group(2).strip().lower()
-            country_code = NAME_TO_CODE.get(country_word)
-            if winner_name and country_code:
-                break
+    # Pattern A: "X won the competition" or "X claimed gold"
+    # The search window is capped — see the WON_RE note up top.
+    for m in WON_RE.finditer(text_only[:200000]):
+        country_word = m.group(2).casefold()
+        if country_word in _STOPWORDS:
+            continue
+        winner_name = m.group(1).strip()
+        country_code = NAME_TO_CODE.get(country_word)
+        if winner_name and country_code:
+            break
     
     # Pattern B: Look for medalist template in HTML
     # Wikipedia often has: <th>Gold</th>...<td>...<a>Name</a>...<a>Country</a>
     if not winner_name:
         # Look for gold medalist in infobox - must have both gold AND silver nearby
         # This prevents matching random "gold" mentions
-        gold_section = re.search(
-            r'(?:1st\s*place|Gold|gold_medalist|🥇).*?<a[^>]*title="([^"]+)"[^>]*>([^<]+)</a>',
-            html, re.DOTALL | re.IGNORECASE
-        )
-        silver_section = re.search(
-            r'(?:2nd\s*place|Silver|silver_medalist|🥈)',
-            html, re.IGNORECASE
-        )
+        gold_section = GOLD_SECTION_RE.search(html)
+        silver_section = SILVER_MARKER_RE.search(html)
         
         # Only trust gold match if silver is also present (confirms it's a results section)
         if gold_section and silver_section:
@@ -535,17 +977,14 @@ def scrape_event_result(event_id):
                     winner_name = candidate
                     # Find country code nearby
                     context = html[gold_section.start():gold_section.end()+500]
-                    code_match = re.search(r'\(([A-Z]{3})\)', context)
-                    if code_match:
+                    code_match = CODE_PAREN_RE.search(context)
+                    if code_match and code_match.group(1) in VALID_IOC_CODES:
                         country_code = code_match.group(1)
     
     # Pattern C: Look for results table with rank column
     if not winner_name:
         # Find a table row with rank "1" and extract the athlete name
-        rank1_match = re.search(
-            r'<t[dh][^>]*>\s*1\s*</t[dh]>.*?<a[^>]*title="([^"]+)"[^>]*>([^<]+)</a>',
-            html, re.DOTALL
-        )
+        rank1_match = RANK1_RE.search(html)
         if rank1_match:
             candidate = rank1_match.group(2).strip()
             words = candidate.split()
@@ -553,12 +992,12 @@ def scrape_event_result(event_id):
                 if all(w[0].isupper() for w in words if w):
                     winner_name = candidate
                     context = html[rank1_match.start():rank1_match.end()+500]
-                    code_match = re.search(r'\(([A-Z]{3})\)', context)
-                    if code_match:
+                    code_match = CODE_PAREN_RE.search(context)
+                    if code_match and code_match.group(1) in VALID_IOC_CODES:
                         country_code = code_match.group(1)
 
     if not winner_name:
-        return None, _extract_recap(html)
+        return None, _extract_recap(paragraphs)
 
     # Final validation: result must look like a real name
     # Reject single words, numbers, or very short strings
@@ -567,16 +1006,14 @@ def scrape_event_result(event_id):
         return None, None
 
     # Reject known garbage patterns
-    garbage = ['ROUND', 'FINAL', 'QUALIFICATION', 'TRAINING', 'OFFICIAL', 'SESSION',
-               'MEDAL', 'EVENT', 'COMPETITION', 'OLYMPIC', 'WINTER', 'GAMES']
-    if surname in garbage or winner_name.upper() in garbage:
+    if surname in _GARBAGE_WORDS or winner_name.upper() in _GARBAGE_WORDS:
         return None, None
 
-    recap = _extract_recap(html, winner_name, country_code)
+    recap = _extract_recap(paragraphs, winner_name, country_code)
 
     # Fallback: if no country code yet, look for "Name of Country" in lead paragraph
     if not country_code:
-        text_clean = re.sub(r'\s+', ' ', text_only)
+        text_clean = text_only  # already whitespace-normalized
         # Pattern: "Surname of [the] Country" — try known country names
         of_match = re.search(
             rf'{re.escape(surname)}\s+of\s+(the\s+)?(\w+(?:\s+\w+)?(?:\s+\w+)?)',
@@ -584,13 +1021,10 @@ def scrape_event_result(event_id):
         )
         if of_match:
             raw = ((of_match.group(1) or '') + of_match.group(2)).strip().lower()
-            # Try progressively shorter fragments
-            words = raw.split()
-            for n in range(len(words), 0, -1):
-                candidate = ' '.join(words[:n])
-                country_code = NAME_TO_CODE.get(candidate)
-                if country_code:
-                    break
+            # One scan against every known name, longest first
+            alt_match = NAME_ALT_RE.search(raw)
+            if alt_match:
+                country_code = WIKI_NAME_TO_CODE[alt_match.group(1).lower()]
         # Also try: "Country, with Name" (team events)
         if not country_code:
             team_match = re.search(
@@ -607,6 +1041,70 @@ def scrape_event_result(event_id):
         return f"🥇 {surname}", recap
 
 
+# Score patterns like "United States 5–1 (1–0, 3–1, 1–0) Finland".
+# Wikipedia format: scores are tight around en-dash, followed by optional
+# period breakdown in parentheses before the opponent name.
+_SCORE_SEP = r'[–\-—]'
+_PERIOD_SCORES = r'(?:\s*\([^)]*\))?'
+
+
+@lru_cache(maxsize=None)
+def _game_score_patterns(opponent):
+    """Compiled game-score regexes for one opponent: (pattern, opponent_first)."""
+    return (
+        # USA listed first: "United States 5–0 (1–0, 3–0, 1–0) Finland"
+        (re.compile(rf'United States\s+(\d+){_SCORE_SEP}(\d+){_PERIOD_SCORES}\s+{opponent}',
+                    re.IGNORECASE), False),
+        # Opponent listed first: "Switzerland 0–5 (0–1, 0–1, 0–3) United States"
+        (re.compile(rf'{opponent}\s+(\d+){_SCORE_SEP}(\d+){_PERIOD_SCORES}\s+United States',
+                    re.IGNORECASE), True),
+    )
+
+
+@lru_cache(maxsize=None)
+def _table_score_patterns(opponent):
+    """Compiled curling-table regexes for one opponent: (pattern, opponent_first)."""
+    return (
+        # Opponent row then USA row — grab last number before "United States"
+        (re.compile(rf'{opponent}\s*\([^)]*\)(?:\s+\d+)*\s+(\d+)\s+'
+                    rf'United States\s*\([^)]*\)(?:\s+\d+)*\s+(\d+)',
+                    re.IGNORECASE), True),
+        # USA row then opponent row
+        (re.compile(rf'United States\s*\([^)]*\)(?:\s+\d+)*\s+(\d+)\s+'
+                    rf'{opponent}\s*\([^)]*\)(?:\s+\d+)*\s+(\d+)',
+                    re.IGNORECASE), False),
+    )
+
+
+# Raw-HTML slice taken around each box-score marker; generously sized so
+# a whole scoreboard table always fits
+_SCOREBOARD_WINDOW = 20000
+
+
+def _scoreboard_windows(page_html):
+    """Raw-HTML slices around each ice-hockey box-score table, if any."""
+    windows = []
+    idx = page_html.find('ice-hockey-box')
+    while idx != -1:
+        windows.append(page_html[idx:idx + _SCOREBOARD_WINDOW])
+        idx = page_html.find('ice-hockey-box', idx + _SCOREBOARD_WINDOW)
+    return windows
+
+
+# Scoreboard text per tournament URL — several event IDs share one
+# tournament page, so extract its box-score text once per run
+_SCOREBOARD_CACHE = {}
+
+
+def _scoreboard_texts(url, page_html):
+    """Extracted text of each box-score window on a page; cached per run."""
+    texts = _SCOREBOARD_CACHE.get(url)
+    if texts is None:
+        texts = [html_to_text(w) for w in _scoreboard_windows(page_html)]
+        _SCOREBOARD_CACHE[url] = texts
+    return texts
+
+
 def scrape_tournament_game_result(event_id):
     """
     Scrape a tournament game result (hockey/curling) from Wikipedia.
@@ -618,29 +1116,23 @@ def scrape_tournament_game_result(event_id):
 
     wiki_slug, opponent = info
     url = f"https://en.wikipedia.org/wiki/{wiki_slug}"
-    html = fetch_url(url)
-    if not html:
+    page_html = fetch_url(url)
+    if not page_html:
+        return None, None
+    # Tag-stripped, entity-decoded, whitespace-collapsed page text
+    text = page_text(url)
+    if not text:
         return None, None
 
-    # Strip HTML tags, decode entities (&nbsp; &ndash; etc.), collapse whitespace
-    text = re.sub(r'<[^>]+>', ' ', html)
-    text = html_mod.unescape(text)
-    text = re.sub(r'\s+', ' ', text)
-
-    # Look for score patterns like "United States 5–1 (1–0, 3–1, 1–0) Finland"
-    # Wikipedia format: scores are tight around en-dash, followed by optional
-    # period breakdown in parentheses before the opponent name.
-    score_sep = r'[–\-—]'
-    period_scores = r'(?:\s*\([^)]*\))?'
-    patterns = [
-        # USA listed first: "United States 5–0 (1–0, 3–0, 1–0) Finland"
-        (rf'United States\s+(\d+){score_sep}(\d+){period_scores}\s+{opponent}', False),
-        # Opponent listed first: "Switzerland 0–5 (0–1, 0–1, 0–3) United States"
-        (rf'{opponent}\s+(\d+){score_sep}(\d+){period_scores}\s+United States', True),
-    ]
+    # Hockey pages carry the score inside ice-hockey-box tables. Those
+    # slices are a few KB against a multi-hundred-KB page, so search
+    # their text first and only fall back to the whole page (curling
+    # pages, layout changes) when they yield nothing.
+    candidates = _scoreboard_texts(url, page_html) + [text]
 
-    for pattern, opponent_first in patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
+    for pattern, opponent_first in _game_score_patterns(opponent):
+        match = next(
+            (m for cand in candidates if (m := pattern.search(cand))), None)
         if match:
             if opponent_first:
                 opp_score = int(match.group(1))
@@ -669,15 +1161,8 @@ def scrape_tournament_game_result(event_id):
             gold_section = text[idx:]
             break
 
-    table_patterns = [
-        # Opponent row then USA row — grab last number before "United States"
-        (rf'{opponent}\s*\([^)]*\)(?:\s+\d+)*\s+(\d+)\s+United States\s*\([^)]*\)(?:\s+\d+)*\s+(\d+)', True),
-        # USA row then opponent row
-        (rf'United States\s*\([^)]*\)(?:\s+\d+)*\s+(\d+)\s+{opponent}\s*\([^)]*\)(?:\s+\d+)*\s+(\d+)', False),
-    ]
-
-    for pattern, opponent_first in table_patterns:
-        match = re.search(pattern, gold_section, re.IGNORECASE)
+    for pattern, opponent_first in _table_score_patterns(opponent):
+        match = pattern.search(gold_section)
         if match:
             if opponent_first:
                 opp_score = int(match.group(1))
@@ -700,13 +1185,43 @@ def scrape_tournament_game_result(event_id):
     return None, None
 
 
+# How long a no-result scrape stays fresh before the event is retried
+# (doubling per empty attempt up to the cap — Wikipedia usually catches
+# up within hours, so pages still empty after several tries are polled
+# ever more rarely), and how long cache entries are kept at all
+SCRAPE_RETRY_MINUTES = 30
+SCRAPE_RETRY_MAX_HOURS = 6
+SCRAPE_CACHE_DAYS = 7
+
+
 def update_event_results(data):
     """
     For events marked done but without results, try to scrape Wikipedia.
     Checks medal events (🏅 in title) and tournament games (hockey/curling).
     Also updates the event description with a short recap when available.
+    Scrape attempts are recorded in data["_scrape_cache"] so frequent cron
+    runs don't re-fetch events that had no result minutes ago.
     """
     print("\n🔍 Checking for event results on Wikipedia...")
+
+    now = datetime.now(timezone.utc)
+    cache = data.setdefault("_scrape_cache", {})
+
+    # Drop malformed or long-stale cache entries
+    dirty = False
+    for eid in list(cache):
+        try:
+            checked = datetime.fromisoformat(cache[eid]["checked_at"])
+        except (KeyError, TypeError, ValueError):
+            del cache[eid]
+            dirty = True
+            continue
+        if now - checked > timedelta(days=SCRAPE_CACHE_DAYS):
+            del cache[eid]
+            dirty = True
+
+    # Collect the events that still need a result, with their scraper
+    targets = []
     for event in data["schedule"]:
         if not event["done"]:
             continue
@@ -714,49 +1229,90 @@ def update_event_results(data):
             continue
 
         eid = event["id"]
+        entry = cache.get(eid)
+        if entry and not entry.get("result"):
+            # Checked recently with no result — Wikipedia won't have
+            # caught up in the last few minutes either. Each empty
+            # attempt doubles the wait before the next retry.
+            checked = datetime.fromisoformat(entry["checked_at"])
+            backoff = min(
+                timedelta(minutes=SCRAPE_RETRY_MINUTES) * 2 ** (entry.get("attempts", 1) - 1),
+                timedelta(hours=SCRAPE_RETRY_MAX_HOURS))
+            if now - checked < backoff:
+                continue
 
-        # Medal events — scrape for gold medalist
-        if "🏅" in event.get("title", "") and eid in EVENT_WIKI_MAP:
-            print(f"  📄 Checking {event['title'][:40]}...")
-            result, recap = scrape_event_result(eid)
-            if result:
-                event["result"] = result
-                print(f"     → {result}")
-                if recap:
-                    event["desc"] = recap
-                    print(f"     📝 {recap}")
-            else:
-                print(f"     → No result found yet")
-            continue
+        if eid in MEDAL_EIDS:
+            # Medal events — scrape for gold medalist
+            targets.append((event, scrape_event_result))
+        elif eid in TOURNAMENT_EIDS:
+            # Tournament games — scrape for score
+            targets.append((event, scrape_tournament_game_result))
+
+    if not targets:
+        return dirty
+
+    # Each scrape is an independent network round-trip, so run them on a
+    # thread pool (the pooled session is shared) and apply the results on
+    # the main thread
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = [executor.submit(scraper, event["id"])
+                   for event, scraper in targets]
+
+    for (event, _scraper), future in zip(targets, futures):
+        print(f"  📄 Checking {event['title'][:40]}...")
+        result, recap = future.result()
+        entry = {"checked_at": now.isoformat(), "result": result}
+        if not result:
+            prev = cache.get(event["id"]) or {}
+            entry["attempts"] = prev.get("attempts", 0) + 1
+        cache[event["id"]] = entry
+        if result:
+            event["result"] = result
+            print(f"     → {result}")
+            if recap:
+                event["desc"] = recap
+                print(f"     📝 {recap}")
+        else:
+            print(f"     → No result found yet")
 
-        # Tournament games — scrape for score
-        if eid in TOURNAMENT_GAME_MAP:
-            print(f"  📄 Checking {event['title'][:40]}...")
-            result, recap = scrape_tournament_game_result(eid)
-            if result:
-                event["result"] = result
-                print(f"     → {result}")
-                if recap:
-                    event["desc"] = recap
-                    print(f"     📝 {recap}")
-            else:
-                print(f"     → No result found yet")
+    # Every target refreshed its cache entry, so data changed either way
+    return True
+
+
+# Longer-form events need a bigger threshold before being marked done
+LONG_EVENT_MINUTES = {
+    "hockey": 180,    # ~3 hours with intermissions/OT
+    "curling": 180,   # ~3 hours per match
+    "ceremony": 210,  # opening/closing ceremonies
+}
 
 
 def _event_duration_minutes(event):
     """Return expected duration in minutes based on event tags."""
-    # Longer-form events need a bigger threshold before being marked done
-    LONG_EVENTS = {
-        "hockey": 180,    # ~3 hours with intermissions/OT
-        "curling": 180,   # ~3 hours per match
-        "ceremony": 210,  # opening/closing ceremonies
-    }
     for tag in event.get("tags", []):
-        if tag in LONG_EVENTS:
-            return LONG_EVENTS[tag]
+        if tag in LONG_EVENT_MINUTES:
+            return LONG_EVENT_MINUTES[tag]
     return 90  # default for most events
 
 
+def _parse_event_dt(date_str, time_str, tz):
+    """
+    Parse "2026-02-12" + "5:30 AM" into an aware datetime. Equivalent to
+    strptime("%Y-%m-%d %I:%M %p") but without re-interpreting the format
+    string per call — this runs once per schedule entry every update.
+    Raises ValueError on malformed input, like strptime.
+    """
+    year, month, day = date_str.split("-")
+    clock, ampm = time_str.split(" ")
+    hour_str, minute_str = clock.split(":")
+    hour = int(hour_str) % 12
+    if ampm == "PM":
+        hour += 12
+    elif ampm != "AM":
+        raise ValueError(f"bad AM/PM marker: {time_str!r}")
+    return datetime(int(year), int(month), int(day), hour, int(minute_str), tzinfo=tz)
+
+
 def mark_past_events_done(data):
     """
     Mark events as done if their date+time is in the past.
@@ -765,6 +1321,7 @@ def mark_past_events_done(data):
     """
     et = timezone(timedelta(hours=-5))  # Eastern Time
     now = datetime.now(et)
+    marked = []
 
     for event in data["schedule"]:
         if event["done"]:
@@ -777,21 +1334,45 @@ def mark_past_events_done(data):
             continue
 
         try:
-            # Parse "2026-02-12" and "5:30 AM"
-            dt = datetime.strptime(f"{date_str} {time_str}", "%Y-%m-%d %I:%M %p")
-            dt = dt.replace(tzinfo=et)
+            dt = _parse_event_dt(date_str, time_str, et)
 
             # Mark as done if enough time has passed for this event type
             duration = _event_duration_minutes(event)
             if now - dt > timedelta(minutes=duration):
                 event["done"] = True
-                print(f"  ✅ Auto-marked done: {event['title']}")
+                marked.append(f"  ✅ Auto-marked done: {event['title']}")
         except ValueError:
             continue
 
+    # One write instead of one flush per marked event
+    if marked:
+        print("\n".join(marked))
+    return bool(marked)
+
 
 YAHOO_SCHEDULE_URL = "https://sports.yahoo.com/olympics/article/2026-winter-olympics-milan-cortina-daily-schedule-streaming-tv-times-193334165.html"
 
+# Patterns for the per-line Yahoo schedule walk, compiled once — the
+# loop runs them on every line of the article
+DAY_HEADER_RE = re.compile(
+    r'(?:Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday),?\s+'
+    r'(Feb\.?|February|Mar\.?)\s+(\d+),?\s+2026'
+)
+HAS_TIME_RE = re.compile(r'\d{1,2}:\d{2}')
+AIRS_AT_RE = re.compile(r'airs at \d', re.IGNORECASE)
+TIME_LINE_RE = re.compile(r'(\d{1,2}:\d{2}\s*(?:a\.m\.|p\.m\.))\s*:?\s*(.*)')
+
+# Normalizes "4:30  a.m." → "4:30 AM" in one pass: AM/PM markers and
+# whitespace runs are rewritten by a single substitution instead of two
+# str.replace copies plus a separate whitespace regex
+_TIME_NORM_RE = re.compile(r'a\.m\.|p\.m\.|\s+')
+_TIME_NORM_MAP = {'a.m.': 'AM', 'p.m.': 'PM'}
+
+
+def _normalize_time(raw_time):
+    return _TIME_NORM_RE.sub(
+        lambda m: _TIME_NORM_MAP.get(m.group(0), ' '), raw_time).strip()
+
 # Map our event ID prefixes to Yahoo sport header keywords
 SPORT_KEYWORDS = {
     "alp": ["alpine skiing"],
@@ -859,6 +1440,34 @@ SUBSECTION_KEYWORDS = {
     "sl": ["slalom"],
 }
 
+# Flattened keyword lookups for the header detection above: one
+# alternation scan (longest keyword first) finds any sport/subsection
+# keyword, replacing a nested any() over every keyword list per line
+SPORT_KW_TO_PREFIX = {kw: prefix
+                      for prefix, kws in SPORT_KEYWORDS.items() for kw in kws}
+SPORT_KW_RE = re.compile('|'.join(
+    re.escape(k) for k in sorted(SPORT_KW_TO_PREFIX, key=len, reverse=True)))
+SUBSECTION_KW_RE = re.compile('|'.join(
+    re.escape(k) for k in sorted((kw for kws in SUBSECTION_KEYWORDS.values()
+                                  for kw in kws), key=len, reverse=True)))
+
+
+@lru_cache(maxsize=None)
+def _classify_eid(eid):
+    """
+    Precompute the static classification of an event ID: its sport prefix,
+    the subsection keywords its segments map to (first hit wins), and the
+    EVENT_KEYWORDS entries whose suffix appears in it. Event IDs never
+    change at runtime, so this is cached for the life of the process.
+    """
+    parts = eid.split("-")
+    subsection_kws = next(
+        (SUBSECTION_KEYWORDS[part] for part in parts
+         if part in SUBSECTION_KEYWORDS), None)
+    event_kws = tuple((suffix, kws) for suffix, kws in EVENT_KEYWORDS.items()
+                      if suffix in eid)
+    return parts[0], subsection_kws, event_kws
+
 
 def scrape_schedule_times(data):
     """
@@ -869,14 +1478,10 @@ def scrape_schedule_times(data):
     html = fetch_url(YAHOO_SCHEDULE_URL)
     if not html:
         print("  ⚠️  Could not fetch Yahoo schedule")
-        return
+        return False
 
-    # Parse into text lines
-    text = re.sub(r'<br\s*/?>', '\n', html)
-    text = re.sub(r'</(p|h[1-6]|div|li)>', '\n', text)
-    text = re.sub(r'<[^>]+>', '', text)
-    text = html_mod.unescape(text)
-    lines = [l.strip() for l in text.split('\n') if l.strip()]
+    # Parse into text lines in a single pass
+    lines = html_to_lines(html)
 
     # Build a structured schedule: {date_str: [(time, sport, description), ...]}
     MONTH_MAP = {"Feb.": "02", "February": "02", "Mar.": "03"}
@@ -887,11 +1492,7 @@ def scrape_schedule_times(data):
 
     for line in lines:
         # Day header: "Tuesday, Feb. 10, 2026 (Day 4)"
-        day_match = re.match(
-            r'(?:Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday),?\s+'
-            r'(Feb\.?|February|Mar\.?)\s+(\d+),?\s+2026',
-            line
-        )
+        day_match = DAY_HEADER_RE.match(line)
         if day_match:
             month = MONTH_MAP.get(day_match.group(1), "02")
             day = day_match.group(2).zfill(2)
@@ -903,33 +1504,34 @@ def scrape_schedule_times(data):
         if not current_date:
             continue
 
+        low = line.lower()
+
         # Sport header: a line that's just a sport name (no time)
-        if not re.search(r'\d{1,2}:\d{2}', line) and len(line) < 40:
-            sport_lower = line.lower().strip()
-            if any(kw in sport_lower for kws in SPORT_KEYWORDS.values() for kw in kws):
+        if not HAS_TIME_RE.search(line) and len(line) < 40:
+            sport_lower = low.strip()
+            if SPORT_KW_RE.search(sport_lower):
                 current_sport = sport_lower
                 current_subsection = None
                 continue
             # Subsection header within a sport (e.g., "Halfpipe", "Aerials", "Giant slalom")
             if current_sport:
-                for sub_kws in SUBSECTION_KEYWORDS.values():
-                    if any(kw in sport_lower for kw in sub_kws):
-                        current_subsection = sport_lower
-                        break
+                if SUBSECTION_KW_RE.search(sport_lower):
+                    current_subsection = sport_lower
                 continue
 
-        # Skip delayed rebroadcast lines: "airs at 4:30 p.m. on USA"
-        if re.search(r'airs at \d', line, re.IGNORECASE):
+        # Skip delayed rebroadcast lines: "airs at 4:30 p.m. on USA".
+        # The C substring scan screens out the vast majority of lines
+        # before the (case-insensitive) regex confirms a digit follows.
+        if 'airs at' in low and AIRS_AT_RE.search(low):
             continue
 
         # Time line: "4:30 a.m.: Women's qualifying..."
-        time_match = re.match(r'(\d{1,2}:\d{2}\s*(?:a\.m\.|p\.m\.))\s*:?\s*(.*)', line)
+        time_match = TIME_LINE_RE.match(line)
         if time_match and current_sport:
             raw_time = time_match.group(1)
             desc = time_match.group(2).strip()
             # Normalize time: "4:30 a.m." → "4:30 AM"
-            norm_time = raw_time.replace('a.m.', 'AM').replace('p.m.', 'PM')
-            norm_time = re.sub(r'\s+', ' ', norm_time).strip()
+            norm_time = _normalize_time(raw_time)
 
             if current_date not in yahoo_schedule:
                 yahoo_schedule[current_date] = []
@@ -937,46 +1539,44 @@ def scrape_schedule_times(data):
 
     if not yahoo_schedule:
         print("  ⚠️  Could not parse any schedule data")
-        return
+        return False
 
     print(f"  ✅ Parsed schedule for {len(yahoo_schedule)} days")
 
-    # Now match our events to Yahoo entries
-    changes = 0
-    for event in data["schedule"]:
-        if event["done"]:
-            continue
-        if event["time"] == "TBD":
-            continue
+    # Classify each parsed entry by sport prefix once, so the event loop
+    # below does an O(1) index lookup instead of re-scanning the day's
+    # entries with substring checks per event
+    by_sport = {}
+    for ydate, entries in yahoo_schedule.items():
+        for entry in entries:
+            for prefix in {SPORT_KW_TO_PREFIX[kw]
+                           for kw in SPORT_KW_RE.findall(entry[1])}:
+                by_sport.setdefault((ydate, prefix), []).append(entry)
+
+    # One pass to keep only events still worth matching: undone, with a
+    # concrete time, on a day Yahoo actually covers. Late in the Games
+    # that's a handful of events instead of the whole schedule.
+    undone = [event for event in data["schedule"]
+              if not event["done"] and event["time"] != "TBD"
+              and event["date"] in yahoo_schedule]
 
+    # Now match our events to Yahoo entries
+    changes = []
+    for event in undone:
         eid = event["id"]
         edate = event["date"]
+        prefix, event_subsection_kws, event_kws = _classify_eid(eid)
 
-        if edate not in yahoo_schedule:
-            continue
-
-        # Determine sport from event ID prefix
-        prefix = eid.split("-")[0]
-        sport_kws = SPORT_KEYWORDS.get(prefix, [])
-
-        # Find matching Yahoo entries for this date + sport
-        candidates = []
-        for ytime, ysport, ydesc, ysubsection in yahoo_schedule[edate]:
-            if any(kw in ysport for kw in sport_kws):
-                candidates.append((ytime, ydesc, ysubsection))
+        # Matching Yahoo entries for this date + event ID sport prefix
+        candidates = [(ytime, ydesc, ysubsection)
+                      for ytime, _ysport, ydesc, ysubsection
+                      in by_sport.get((edate, prefix), ())]
 
         if not candidates:
             continue
 
         # Filter candidates by subsection if the event ID maps to one
         # e.g., frs-w-hp should only match entries under a "Halfpipe" subsection
-        eid_parts = eid.split("-")
-        event_subsection_kws = None
-        for part in eid_parts:
-            if part in SUBSECTION_KEYWORDS:
-                event_subsection_kws = SUBSECTION_KEYWORDS[part]
-                break
-
         if event_subsection_kws:
             subsection_filtered = [
                 (ytime, ydesc, ysub) for ytime, ydesc, ysub in candidates
@@ -995,24 +1595,50 @@ def scrape_schedule_times(data):
             matched_time = candidates[0][0]
         else:
             # Try to match by event keywords
-            for suffix, kws in EVENT_KEYWORDS.items():
-                if suffix in eid:
-                    for ytime, ydesc, _ysub in candidates:
-                        if any(kw in ydesc for kw in kws):
-                            matched_time = ytime
-                            break
-                    if matched_time:
+            for _suffix, kws in event_kws:
+                for ytime, ydesc, _ysub in candidates:
+                    if any(kw in ydesc for kw in kws):
+                        matched_time = ytime
                         break
+                if matched_time:
+                    break
 
         if matched_time and matched_time != event["time"]:
-            print(f"  ⏰ {event['title'][:40]}: {event['time']} → {matched_time}")
+            changes.append(f"  ⏰ {event['title'][:40]}: {event['time']} → {matched_time}")
             event["time"] = matched_time
-            changes += 1
 
+    # Batched so the matching loop doesn't flush stdout per change
     if changes:
-        print(f"  📅 Updated {changes} event time(s)")
+        print("\n".join(changes))
+        print(f"  📅 Updated {len(changes)} event time(s)")
     else:
         print("  ✅ All times match")
+    return bool(changes)
+
+
+# (table, {code: row}) for the last medal_table seen by medal_row;
+# rebuilt only when the list object is replaced by a fresh scrape
+_MEDAL_INDEX = [None, None]
+
+
+def medal_row(data, code):
+    """
+    Look up a medal-table row by IOC code in O(1), mirroring build.py's
+    by_code index. The index is cached against the table list itself, so
+    repeated lookups within and across steps don't rescan the table.
+    """
+    table = data.get("medal_table")
+    if not table:
+        return None
+    if _MEDAL_INDEX[0] is not table:
+        _MEDAL_INDEX[0] = table
+        _MEDAL_INDEX[1] = {m["code"]: m for m in table}
+    return _MEDAL_INDEX[1].get(code)
+
+
+def _div_round(num, den):
+    """round(num / den) for positive ints, with halves rounding up."""
+    return (2 * num + den) // (2 * den)
 
 
 def update_projections(data):
@@ -1023,40 +1649,45 @@ def update_projections(data):
     events_done = data.get("events_completed", 0)
     events_total = data.get("events_total", 116)
     if events_done < 1:
-        return
+        return False
 
-    usa = next((m for m in data.get("medal_table", []) if m["code"] == "USA"), None)
+    usa = medal_row(data, "USA")
     if not usa:
-        return
+        return False
 
     gold_now = usa["gold"]
     total_now = usa["total"]
-    pct_done = events_done / events_total
+    done, total = events_done, events_total
 
     # Project based on current pace, with slight regression toward pre-Games
-    # expectations (10G, 30T) to handle early variance
+    # expectations (10G, 30T) to handle early variance. The blend is
+    #   w * medals_now / pct_done + (1 - w) * pre,  w = min(1.5 * pct, 0.9)
+    # computed as exact integer fractions so the output never shifts with
+    # floating-point details; halves round up rather than to-even.
     pre_gold = 10
     pre_total = 30
-    # Weight current pace more as Games progress
-    pace_weight = min(pct_done * 1.5, 0.9)  # caps at 90% pace weight
-
-    pace_gold = gold_now / pct_done if pct_done > 0 else pre_gold
-    pace_total = total_now / pct_done if pct_done > 0 else pre_total
-
-    proj_gold = round(pace_weight * pace_gold + (1 - pace_weight) * pre_gold)
-    proj_total = round(pace_weight * pace_total + (1 - pace_weight) * pre_total)
+    if 5 * done <= 3 * total:
+        # pace weight below the 90% cap: w = 3*done / (2*total)
+        proj_gold = _div_round(
+            3 * gold_now * total + pre_gold * (2 * total - 3 * done), 2 * total)
+        proj_total = _div_round(
+            3 * total_now * total + pre_total * (2 * total - 3 * done), 2 * total)
+    else:
+        # weight capped at 0.9
+        proj_gold = _div_round(9 * gold_now * total + pre_gold * done, 10 * done)
+        proj_total = _div_round(9 * total_now * total + pre_total * done, 10 * done)
 
     # Projections can't be less than what's already won
     proj_gold = max(proj_gold, gold_now)
     proj_total = max(proj_total, total_now)
 
     # Range: ±20% of mid projection, floored at current count
-    gold_low = max(round(proj_gold * 0.8), gold_now)
-    gold_high = round(proj_gold * 1.2)
-    total_low = max(round(proj_total * 0.8), total_now)
-    total_high = round(proj_total * 1.2)
+    gold_low = max(_div_round(4 * proj_gold, 5), gold_now)
+    gold_high = _div_round(6 * proj_gold, 5)
+    total_low = max(_div_round(4 * proj_total, 5), total_now)
+    total_high = _div_round(6 * proj_total, 5)
 
-    data["usa_projection"] = {
+    projection = {
         "projected_gold_low": gold_low,
         "projected_gold_high": gold_high,
         "projected_gold_mid": proj_gold,
@@ -1064,7 +1695,33 @@ def update_projections(data):
         "projected_total_high": total_high,
         "projected_total_mid": proj_total,
     }
+    if projection == data.get("usa_projection"):
+        return False
+    data["usa_projection"] = projection
     print(f"\n📈 Updated projections: {proj_gold}G ({gold_low}-{gold_high}), {proj_total}T ({total_low}-{total_high})")
+    return True
+
+
+def load_data():
+    """Read data.json, decoding with orjson's C parser when available."""
+    with open(DATA_FILE, "rb") as f:
+        return _loads(f.read())
+
+
+def save_data(data):
+    """
+    Write data.json atomically: encode to bytes (orjson when available,
+    it serializes in C), write a temp file, then os.replace over the
+    real one so a crash mid-write can't leave a truncated data.json.
+    """
+    if orjson is not None:
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    else:
+        payload = json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+    tmp_file = DATA_FILE + ".tmp"
+    with open(tmp_file, "wb") as f:
+        f.write(payload)
+    os.replace(tmp_file, DATA_FILE)
 
 
 def main():
@@ -1073,53 +1730,65 @@ def main():
     print()
 
     # Load current data
-    with open(DATA_FILE, "r") as f:
-        data = json.load(f)
+    data = load_data()
 
     updated = False
 
     # --- Step 1: Try Wikipedia scrape ---
     print("📡 Fetching Wikipedia medal table...")
     html = fetch_url(WIKI_MEDAL_URL)
-    medals = parse_wiki_medal_table(html)
-    events_done = parse_events_completed(html)
-
-    if medals:
-        print(f"  ✅ Got {len(medals)} countries from Wikipedia")
-        data["medal_table"] = medals
-        updated = True
-
-        # Log USA status
-        usa = next((m for m in medals if m["code"] == "USA"), None)
-        if usa:
-            print(f"  🇺🇸 USA: {usa['gold']}G {usa['silver']}S {usa['bronze']}B = {usa['total']} total")
+
+    # Identical page bytes parse to identical results, so a digest match
+    # against the previous run skips both extractions outright
+    page_sha = (hashlib.blake2b(html.encode("utf-8"), digest_size=16).hexdigest()
+                if html else None)
+    if page_sha and page_sha == data.get("_medal_page_sha") and data.get("medal_table"):
+        print("  ✅ Medal table page unchanged since last run")
     else:
-        print("  ❌ Wikipedia scrape failed. No fallback configured.")
-        print("  💡 To add Claude API fallback, set ANTHROPIC_API_KEY env var.")
+        medals = parse_wiki_medal_table(html)
+        events_done = parse_events_completed(html)
+
+        if medals:
+            print(f"  ✅ Got {len(medals)} countries from Wikipedia")
+            data["medal_table"] = medals
+            data["_medal_page_sha"] = page_sha
+            updated = True
+
+            # Log USA status
+            usa = medal_row(data, "USA")
+            if usa:
+                print(f"  🇺🇸 USA: {usa['gold']}G {usa['silver']}S {usa['bronze']}B = {usa['total']} total")
+        else:
+            print("  ❌ Wikipedia scrape failed. No fallback configured.")
+            print("  💡 To add Claude API fallback, set ANTHROPIC_API_KEY env var.")
 
-    if events_done and events_done != data.get("events_completed"):
-        data["events_completed"] = events_done
-        print(f"  📊 Events completed: {events_done}/116")
-        updated = True
+        if events_done and events_done != data.get("events_completed"):
+            data["events_completed"] = events_done
+            print(f"  📊 Events completed: {events_done}/116")
+            updated = True
 
     # --- Step 2: Auto-mark past events as done ---
     print("\n⏰ Checking event times...")
-    mark_past_events_done(data)
+    updated |= mark_past_events_done(data)
 
     # --- Step 2b: Try to fill in results for done medal events ---
-    update_event_results(data)
+    updated |= update_event_results(data)
 
     # --- Step 2c: Sync schedule times from Yahoo ---
-    scrape_schedule_times(data)
+    updated |= scrape_schedule_times(data)
 
     # --- Step 2d: Update projections based on pace ---
-    update_projections(data)
-
-    # --- Step 3: Always update timestamp and save ---
-    data["last_updated"] = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S+00:00")
-    with open(DATA_FILE, "w") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
-    print(f"\n💾 Data saved to {DATA_FILE}")
+    updated |= update_projections(data)
+
+    # --- Step 3: Save, but only when a step actually changed something.
+    # Skipping the rewrite on idle runs also leaves build.py's input
+    # digest untouched, so the whole rebuild is skipped downstream.
+    if updated:
+        data["last_updated"] = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S+00:00")
+        save_data(data)
+        print(f"\n💾 Data saved to {DATA_FILE}")
+    else:
+        print(f"\n💤 No changes this run; {DATA_FILE} left untouched")
 
     print("✅ Done!")
     return 0